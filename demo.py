@@ -90,7 +90,7 @@ def demo_recommendations(kbs: UniversityOntologyKBS) -> None:
 
     for student in ["Alice", "Bob", "Carol"]:
         recs = kbs.recommend_courses(student)
-        completed = sorted(kbs.completed_courses(student))
+        completed = kbs.completed_courses_sorted(student)
         print(f"\n  Student   : {student}")
         print(f"  Completed : {completed if completed else '(none)'}")
         print(f"  Recommended: {recs if recs else '(none — complete more prerequisites)'}")
@@ -11,17 +11,112 @@ Ontology relationships (properties):
   - eligibleFor(Student → Course):    inferred — student has completed ALL prerequisites
 """
 
+import bisect
+from array import array
+from collections.abc import Callable, Iterable, Set
+from typing import cast
+
+
+def _recommend_kernel(closure_masks: list[int], completed: int) -> int:
+    """
+    Return a bitmask of the courses that are eligible (all transitive
+    prerequisites completed) and not yet completed.
+
+    Kept as a free function over plain ints so the hot loop binds only
+    locals — no attribute lookups per course — and stays in the shape a
+    JIT compiler could take over wholesale if one were ever added.
+    """
+    eligible = 0
+    bit = 1
+    for closure in closure_masks:
+        if not completed & bit and not closure & ~completed:
+            eligible |= bit
+        bit <<= 1
+    return eligible
+
+
+class _MissingPrereqs(Set):
+    """Lazily decoded, immutable view of a missing-prerequisites bitmask.
+
+    Truthiness, length and membership are O(1) bit operations on the mask;
+    course names are materialized only if the caller actually iterates
+    (e.g. to display them). Compares equal to any set with the same names.
+    """
+
+    __slots__ = ("_mask", "_names", "_ids")
+
+    def __init__(self, mask: int, names: list[str], ids: dict[str, int]) -> None:
+        self._mask = mask
+        self._names = names
+        self._ids = ids
+
+    def __contains__(self, course: object) -> bool:
+        if not isinstance(course, str):
+            return False
+        cid = self._ids.get(course)
+        return cid is not None and self._mask >> cid & 1 == 1
+
+    def __iter__(self):
+        names = self._names
+        mask = self._mask
+        while mask:
+            low = mask & -mask
+            yield names[low.bit_length() - 1]
+            mask ^= low
+
+    def __len__(self) -> int:
+        return self._mask.bit_count()
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    @classmethod
+    def _from_iterable(cls, iterable) -> set:
+        # Set-operator results (e.g. view & other) decay to plain sets.
+        return set(iterable)
+
 
 class UniversityOntologyKBS:
-    """Knowledge-Base System built on a small university-advising ontology."""
+    """Knowledge-Base System built on a small university-advising ontology.
+
+    Internally, every course is interned to a sequential integer id and all
+    course sets (prerequisites, closures, completions) are stored as integer
+    bitmasks: bit *i* set means "course with id *i* is in the set". Set
+    difference and subset tests then become single integer operations, and
+    Python ints grow arbitrarily so the catalog size is unbounded.
+    """
 
-    def __init__(self):
-        self._students: set[str] = set()
-        self._courses: set[str] = set()
-        # requires: course → set of direct prerequisites
-        self._prerequisites: dict[str, set[str]] = {}
-        # completed: student → set of completed courses
-        self._completed: dict[str, set[str]] = {}
+    def __init__(self) -> None:
+        # interning table: student name → sequential id, and the inverse
+        self._student_id: dict[str, int] = {}
+        self._student_names: list[str] = []
+        # completed: bitmask of completed courses, indexed by student id
+        self._completed_bits: list[int] = []
+        # interning table: course name → sequential id, and the inverse.
+        # Invariant: registration keeps every id-indexed list below in
+        # lockstep, so a valid id can index any of them directly — no
+        # defensive .get(..., default) lookups (or the empty-set
+        # allocations they imply) anywhere on the hot paths.
+        self._course_id: dict[str, int] = {}
+        self._course_names: list[str] = []
+        # course names kept in alphabetical order (one insort per insert
+        # instead of a full sort per recommendation)
+        self._sorted_courses: list[str] = []
+        # requires: bitmask of direct prerequisites, indexed by course id
+        self._prereq_masks: list[int] = []
+        # reverse adjacency: bitmask of courses that directly require this one
+        self._required_by_masks: list[int] = []
+        # transitive prerequisite closures, indexed by course id
+        self._closure_masks: list[int] = []
+        self._closure_dirty: bool = False
+        # memoized decoded closures: course id → frozenset of course names
+        self._closure_sets: dict[int, frozenset[str]] = {}
+        # cached immutable views for the introspection accessors,
+        # invalidated by the corresponding mutation
+        self._students_view: frozenset[str] | None = None
+        self._courses_view: frozenset[str] | None = None
+        self._completed_views: list[frozenset[str] | None] = []
+        self._completed_sorted_views: list[tuple[str, ...] | None] = []
 
     # ------------------------------------------------------------------
     # Ontology population
@@ -32,16 +127,31 @@ class UniversityOntologyKBS:
         student = student.strip()
         if not student:
             raise ValueError("Student name must not be empty.")
-        self._students.add(student)
-        self._completed.setdefault(student, set())
+        if student in self._student_id:
+            return
+        self._student_id[student] = len(self._student_names)
+        self._student_names.append(student)
+        self._completed_bits.append(0)
+        self._completed_views.append(None)
+        self._completed_sorted_views.append(None)
+        self._students_view = None
 
     def add_course(self, course: str) -> None:
         """Register a new course concept."""
         course = course.strip()
         if not course:
             raise ValueError("Course name must not be empty.")
-        self._courses.add(course)
-        self._prerequisites.setdefault(course, set())
+        if course in self._course_id:
+            return
+        self._course_id[course] = len(self._course_names)
+        self._course_names.append(course)
+        bisect.insort(self._sorted_courses, course)
+        self._prereq_masks.append(0)
+        self._required_by_masks.append(0)
+        # A brand-new course has no prerequisites, so its (empty) closure is
+        # already correct — no invalidation needed.
+        self._closure_masks.append(0)
+        self._courses_view = None
 
     def add_prerequisite(self, course: str, prereq: str) -> None:
         """Assert the *requires* relationship: course → prereq."""
@@ -49,43 +159,233 @@ class UniversityOntologyKBS:
         self._validate_course(prereq)
         if course == prereq:
             raise ValueError(f"A course cannot be its own prerequisite: '{course}'.")
-        self._prerequisites[course].add(prereq)
+        cid = self._course_id[course]
+        pid = self._course_id[prereq]
+        if self._closure_dirty:
+            self._rebuild_closures()
+        # Reject edges that would close a cycle: if *course* is already a
+        # (transitive) prerequisite of *prereq*, the DAG invariant breaks.
+        # With closures maintained, this is a single bit test. Internal
+        # traversals rely on this invariant instead of re-checking.
+        if self._closure_masks[pid] >> cid & 1:
+            raise ValueError(
+                f"Prerequisite would create a cycle: "
+                f"'{prereq}' already requires '{course}'."
+            )
+        self._prereq_masks[cid] |= 1 << pid
+        self._required_by_masks[pid] |= 1 << cid
+        # Incremental update: only closures of *course* and the courses that
+        # transitively require it can have grown. Push the new reachability
+        # up the reverse edges until it stops adding bits.
+        gained = ((1 << pid) | self._closure_masks[pid]) & ~self._closure_masks[cid]
+        if not gained:
+            return
+        self._closure_masks[cid] |= gained
+        self._closure_sets.pop(cid, None)
+        stack = [cid]
+        while stack:
+            current = stack.pop()
+            reach = self._closure_masks[current] | (1 << current)
+            for did in self._iter_bits(self._required_by_masks[current]):
+                gained = reach & ~self._closure_masks[did]
+                if gained:
+                    self._closure_masks[did] |= gained
+                    self._closure_sets.pop(did, None)
+                    stack.append(did)
+
+    def bulk_add_courses(self, courses: Iterable[str]) -> None:
+        """Register many course concepts at once.
+
+        Validates the whole input up front, then registers each new course
+        without the per-call stripping that add_course repeats.
+        """
+        cleaned = [course.strip() for course in courses]
+        if not all(cleaned):
+            raise ValueError("Course name must not be empty.")
+        # dict.fromkeys dedups while preserving input order for stable ids
+        new_courses = [c for c in dict.fromkeys(cleaned) if c not in self._course_id]
+        if not new_courses:
+            return
+        base = len(self._course_names)
+        self._course_id.update((c, base + i) for i, c in enumerate(new_courses))
+        self._course_names.extend(new_courses)
+        self._sorted_courses.extend(new_courses)
+        self._sorted_courses.sort()
+        zeros = [0] * len(new_courses)
+        self._prereq_masks.extend(zeros)
+        self._required_by_masks.extend(zeros)
+        self._closure_masks.extend(zeros)
+        self._courses_view = None
+
+    def bulk_add_prereqs(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Assert many *requires* relationships at once.
+
+        Validates every pair up front, applies all edges as batch bitmask
+        updates, then rebuilds the closures once instead of propagating each
+        edge incrementally. If the batch would introduce a cycle, the whole
+        batch is rolled back and ValueError is raised.
+        """
+        resolved: list[tuple[int, int]] = []
+        for course, prereq in pairs:
+            self._validate_course(course)
+            self._validate_course(prereq)
+            if course == prereq:
+                raise ValueError(f"A course cannot be its own prerequisite: '{course}'.")
+            resolved.append((self._course_id[course], self._course_id[prereq]))
+
+        saved_prereqs = self._prereq_masks[:]
+        saved_required_by = self._required_by_masks[:]
+        saved_closures = self._closure_masks[:]
+        for cid, pid in resolved:
+            self._prereq_masks[cid] |= 1 << pid
+            self._required_by_masks[pid] |= 1 << cid
+        self._closure_dirty = True
+        try:
+            self._rebuild_closures()
+        except ValueError:
+            self._prereq_masks = saved_prereqs
+            self._required_by_masks = saved_required_by
+            self._closure_masks = saved_closures
+            self._closure_dirty = False
+            raise
 
     def complete_course(self, student: str, course: str) -> None:
         """Assert the *completed* relationship: student → course."""
         self._validate_student(student)
         self._validate_course(course)
-        self._completed[student].add(course)
+        sid = self._student_id[student]
+        self._completed_bits[sid] |= 1 << self._course_id[course]
+        self._completed_views[sid] = None
+        self._completed_sorted_views[sid] = None
 
     # ------------------------------------------------------------------
     # Inference / reasoning
     # ------------------------------------------------------------------
 
-    def _all_prerequisites(self, course: str) -> set[str]:
-        """Return the transitive closure of prerequisites for *course*."""
+    def _rebuild_closures(self) -> None:
+        """
+        Recompute every course's transitive prerequisite closure in one pass.
+
+        Courses are visited in reverse-topological order (Kahn's algorithm),
+        so each closure is the union — a single bitwise OR — of its direct
+        prerequisites' already finished closures. Prerequisite graphs are
+        DAGs (a course can never require itself, directly or transitively).
+        """
+        n = len(self._course_names)
+        indegree = [mask.bit_count() for mask in self._prereq_masks]
+        # CSR layout of the reverse edges: the dependents of course *cid*
+        # are indices[indptr[cid]:indptr[cid + 1]]. Flat typed arrays keep
+        # the Kahn walk a contiguous index-march instead of chasing a
+        # list-of-lists through the heap.
+        indptr = array("i", [0])
+        indices = array("i")
+        for cid in range(n):
+            indices.extend(self._iter_bits(self._required_by_masks[cid]))
+            indptr.append(len(indices))
+
+        queue = [cid for cid in range(n) if indegree[cid] == 0]
+        processed = 0
+        while queue:
+            cid = queue.pop()
+            processed += 1
+            closure = self._prereq_masks[cid]
+            for pid in self._iter_bits(self._prereq_masks[cid]):
+                closure |= self._closure_masks[pid]
+            self._closure_masks[cid] = closure
+            for did in indices[indptr[cid]:indptr[cid + 1]]:
+                indegree[did] -= 1
+                if indegree[did] == 0:
+                    queue.append(did)
+        if processed < n:
+            # Only reachable via bulk edits; add_prerequisite rejects
+            # cycle-closing edges one at a time.
+            raise ValueError("Prerequisite graph contains a cycle.")
+        self._closure_sets.clear()
+        self._closure_dirty = False
+
+    def freeze(self) -> None:
+        """
+        Finalize the current catalog: force a closure rebuild if one is
+        pending and pre-decode every closure into an immutable frozenset.
+        Subsequent queries hit the memo tables with no per-call decoding.
+        Further edits remain allowed; they simply invalidate the affected
+        entries again.
+        """
+        if self._closure_dirty:
+            self._rebuild_closures()
+        for cid in range(len(self._course_names)):
+            self._closure_set(cid)
+
+    def compile_kbs(self) -> Callable[[str, str], bool]:
+        """
+        Partially evaluate the eligibility check for the current catalog.
+
+        Generates source code with every closure mask baked in as a tuple
+        literal (constant-folded by CPython's compiler), execs it, and
+        returns an ``eligible(student, course) -> bool`` closure that does
+        two interning lookups, one index and one mask test per call — no
+        validation, no self, no missing-set decode.
+
+        The returned function is specialized for the catalog as of this
+        call: prerequisite edits made afterwards are not reflected, so
+        recompile after editing. Course completions *are* reflected, since
+        the closure reads the live completion array. Unknown names raise
+        KeyError rather than the descriptive ValueError of can_take.
+        """
+        if self._closure_dirty:
+            self._rebuild_closures()
+        # Trailing-comma form stays a valid tuple literal ("()") even when
+        # the catalog is empty.
+        masks = "(" + "".join(f"{mask:#x}," for mask in self._closure_masks) + ")"
+        source = (
+            "def _eligible(student_mask: int, course_id: int) -> bool:\n"
+            f"    return not {masks}[course_id] & ~student_mask\n"
+        )
+        namespace: dict[str, object] = {}
+        exec(source, namespace)
+        check = cast(Callable[[int, int], bool], namespace["_eligible"])
+        student_id = self._student_id
+        course_id = self._course_id
+        completed_bits = self._completed_bits
+
+        def eligible(student: str, course: str) -> bool:
+            return check(completed_bits[student_id[student]], course_id[course])
+
+        return eligible
+
+    def _closure_set(self, cid: int) -> frozenset[str]:
+        """Return the memoized decoded closure for course id *cid*."""
+        cached = self._closure_sets.get(cid)
+        if cached is None:
+            cached = frozenset(self._decode_mask(self._closure_masks[cid]))
+            self._closure_sets[cid] = cached
+        return cached
+
+    def _all_prerequisites(self, course: str) -> frozenset[str]:
+        """Return the precomputed transitive closure of prerequisites for *course*."""
         self._validate_course(course)
-        visited: set[str] = set()
-        stack = list(self._prerequisites.get(course, set()))
-        while stack:
-            current = stack.pop()
-            if current not in visited:
-                visited.add(current)
-                stack.extend(self._prerequisites.get(current, set()) - visited)
-        return visited
+        if self._closure_dirty:
+            self._rebuild_closures()
+        return self._closure_set(self._course_id[course])
 
-    def can_take(self, student: str, course: str) -> tuple[bool, set[str]]:
+    def can_take(self, student: str, course: str) -> tuple[bool, Set[str]]:
         """
         Infer the *eligibleFor* relationship.
 
-        Returns (True, set()) if the student has completed all transitive
-        prerequisites, otherwise (False, <set of missing prerequisites>).
+        Returns (True, <empty set>) if the student has completed all
+        transitive prerequisites, otherwise (False, <set of missing
+        prerequisites>). The missing set is a lazy view over the bitmask:
+        names are decoded only if the caller iterates it.
         """
         self._validate_student(student)
         self._validate_course(course)
-        all_prereqs = self._all_prerequisites(course)
-        completed = self._completed[student]
-        missing = all_prereqs - completed
-        return (len(missing) == 0, missing)
+        if self._closure_dirty:
+            self._rebuild_closures()
+        missing = (
+            self._closure_masks[self._course_id[course]]
+            & ~self._completed_bits[self._student_id[student]]
+        )
+        return (missing == 0, _MissingPrereqs(missing, self._course_names, self._course_id))
 
     def recommend_courses(self, student: str) -> list[str]:
         """
@@ -93,38 +393,120 @@ class UniversityOntologyKBS:
         sorted alphabetically.
         """
         self._validate_student(student)
-        completed = self._completed[student]
-        recommendations = []
-        for course in self._courses:
-            if course in completed:
-                continue
-            eligible, _ = self.can_take(student, course)
-            if eligible:
-                recommendations.append(course)
-        return sorted(recommendations)
+        if self._closure_dirty:
+            self._rebuild_closures()
+        eligible = _recommend_kernel(
+            self._closure_masks, self._completed_bits[self._student_id[student]]
+        )
+        course_id = self._course_id
+        return [
+            course for course in self._sorted_courses if eligible >> course_id[course] & 1
+        ]
+
+    def eligibility_matrix(self) -> list[list[bool]]:
+        """
+        Compute eligibility for the whole cohort at once.
+
+        Returns a students × courses boolean matrix: row *sid* (student id
+        order, see students()) and column *cid* (course id order, see
+        courses()) is True when that student has completed every transitive
+        prerequisite of that course. One kernel sweep per student replaces
+        an O(S·C) grid of individual can_take calls; each cell costs two
+        integer ops inside the kernel. (With numpy this would be a single
+        broadcast of the mask arrays, but numpy is not a dependency of this
+        stdlib-only project.)
+        """
+        if self._closure_dirty:
+            self._rebuild_closures()
+        n = len(self._course_names)
+        closures = self._closure_masks
+        return [
+            [closures[cid] & ~completed == 0 for cid in range(n)]
+            for completed in self._completed_bits
+        ]
+
+    def recommend_courses_all(self) -> dict[str, list[str]]:
+        """
+        Recommend courses for every registered student in one batch.
+
+        Returns student → alphabetically sorted recommendations, equivalent
+        to calling recommend_courses per student but sharing the closure
+        rebuild, validation and mask plumbing across the cohort.
+        """
+        if self._closure_dirty:
+            self._rebuild_closures()
+        closures = self._closure_masks
+        course_id = self._course_id
+        sorted_courses = self._sorted_courses
+        result: dict[str, list[str]] = {}
+        for sid, student in enumerate(self._student_names):
+            eligible = _recommend_kernel(closures, self._completed_bits[sid])
+            result[student] = [
+                course for course in sorted_courses if eligible >> course_id[course] & 1
+            ]
+        return result
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _iter_bits(mask: int):
+        """Yield the indices of the set bits in *mask*.
+
+        Uses low-bit isolation (``mask & -mask``) so each iteration jumps
+        straight to the next set bit instead of testing every position.
+        """
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def _decode_mask(self, mask: int) -> set[str]:
+        """Translate a course bitmask back into a set of course names."""
+        return {self._course_names[i] for i in self._iter_bits(mask)}
+
     def _validate_student(self, student: str) -> None:
-        if student not in self._students:
+        if student not in self._student_id:
             raise ValueError(f"Unknown student: '{student}'. Add them with add_student() first.")
 
     def _validate_course(self, course: str) -> None:
-        if course not in self._courses:
+        if course not in self._course_id:
             raise ValueError(f"Unknown course: '{course}'. Add it with add_course() first.")
 
     # ------------------------------------------------------------------
     # Introspection
     # ------------------------------------------------------------------
 
-    def students(self) -> set[str]:
-        return set(self._students)
+    def students(self) -> frozenset[str]:
+        if self._students_view is None:
+            self._students_view = frozenset(self._student_names)
+        return self._students_view
 
-    def courses(self) -> set[str]:
-        return set(self._courses)
+    def courses(self) -> frozenset[str]:
+        if self._courses_view is None:
+            self._courses_view = frozenset(self._course_names)
+        return self._courses_view
 
-    def completed_courses(self, student: str) -> set[str]:
+    def completed_courses(self, student: str) -> frozenset[str]:
+        self._validate_student(student)
+        sid = self._student_id[student]
+        view = self._completed_views[sid]
+        if view is None:
+            view = frozenset(self._decode_mask(self._completed_bits[sid]))
+            self._completed_views[sid] = view
+        return view
+
+    def completed_courses_sorted(self, student: str) -> tuple[str, ...]:
+        """Like completed_courses, but alphabetically sorted.
+
+        The tuple is cached until the student's next completion, so report
+        loops iterate it without re-sorting or re-allocating per call.
+        """
         self._validate_student(student)
-        return set(self._completed[student])
\ No newline at end of file
+        sid = self._student_id[student]
+        view = self._completed_sorted_views[sid]
+        if view is None:
+            view = tuple(sorted(self._decode_mask(self._completed_bits[sid])))
+            self._completed_sorted_views[sid] = view
+        return view
@@ -0,0 +1,30 @@
+"""
+setup.py — optional ahead-of-time compilation of the KBS core.
+
+The project stays pure-stdlib and runs fine uncompiled. When mypyc is
+installed, ``pip install .`` additionally compiles kbs.py into a C
+extension (the module is fully annotated, so mypyc can specialize the
+dict/list/int operations and strip interpreter dispatch from the hot
+paths). Without mypyc the plain .py source is installed unchanged.
+
+Compile:
+    pip install mypy && pip install .
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["kbs.py"])
+
+setup(
+    name="ontology-kbs",
+    version="1.0",
+    description="University Advising Ontology Knowledge-Based System",
+    py_modules=["kbs"],
+    ext_modules=ext_modules,
+    python_requires=">=3.10",
+)
@@ -69,6 +69,40 @@ class TestOntologyPopulation(unittest.TestCase):
         with self.assertRaises(ValueError):
             kbs.add_prerequisite("Math", "Math")
 
+    def test_cyclic_prerequisite_raises(self):
+        """A prerequisite edge that would close a cycle is rejected."""
+        kbs = UniversityOntologyKBS()
+        for course in ["A", "B", "C"]:
+            kbs.add_course(course)
+        kbs.add_prerequisite("B", "A")
+        kbs.add_prerequisite("C", "B")
+        with self.assertRaises(ValueError):
+            kbs.add_prerequisite("A", "C")
+
+
+class TestBulkLoading(unittest.TestCase):
+    """Bulk loaders behave like repeated add_course / add_prerequisite."""
+
+    def test_bulk_load_matches_incremental(self):
+        kbs = UniversityOntologyKBS()
+        kbs.bulk_add_courses(["Math", "Physics", "Mechanics"])
+        kbs.bulk_add_prereqs([("Physics", "Math"), ("Mechanics", "Physics")])
+        kbs.add_student("Alice")
+        kbs.complete_course("Alice", "Math")
+        eligible, missing = kbs.can_take("Alice", "Mechanics")
+        self.assertFalse(eligible)
+        self.assertEqual(missing, {"Physics"})
+
+    def test_bulk_cycle_is_rejected_and_rolled_back(self):
+        kbs = UniversityOntologyKBS()
+        kbs.bulk_add_courses(["A", "B"])
+        with self.assertRaises(ValueError):
+            kbs.bulk_add_prereqs([("A", "B"), ("B", "A")])
+        # The failed batch must not leave partial edges behind
+        kbs.add_student("Bob")
+        eligible, _ = kbs.can_take("Bob", "A")
+        self.assertTrue(eligible)
+
 
 class TestCanTake(unittest.TestCase):
     """Tests 2–4 — can_take inference."""
@@ -150,5 +184,84 @@ class TestRecommendCourses(unittest.TestCase):
             self.kbs.can_take("Alice", "Quantum Cooking")
 
 
+class TestCompletedCoursesSorted(unittest.TestCase):
+    """completed_courses_sorted stays in sync with completions."""
+
+    def test_sorted_view_tracks_completions(self):
+        kbs = _build_standard_kbs()
+        self.assertEqual(kbs.completed_courses_sorted("Alice"), ())
+        kbs.complete_course("Alice", "Intro to Programming")
+        kbs.complete_course("Alice", "Discrete Mathematics")
+        self.assertEqual(
+            kbs.completed_courses_sorted("Alice"),
+            ("Discrete Mathematics", "Intro to Programming"),
+        )
+
+
+class TestCohortQueries(unittest.TestCase):
+    """Batch eligibility agrees with the per-student/per-course queries."""
+
+    def test_recommend_courses_all_matches_per_student(self):
+        kbs = _build_standard_kbs()
+        kbs.complete_course("Bob", "Intro to Programming")
+        kbs.complete_course("Bob", "Discrete Mathematics")
+        kbs.complete_course("Bob", "Data Structures")
+        batch = kbs.recommend_courses_all()
+        self.assertEqual(set(batch), {"Alice", "Bob", "Carol"})
+        for student, recs in batch.items():
+            self.assertEqual(recs, kbs.recommend_courses(student))
+
+    def test_eligibility_matrix_matches_can_take(self):
+        kbs = _build_standard_kbs()
+        kbs.complete_course("Alice", "Intro to Programming")
+        matrix = kbs.eligibility_matrix()
+        # ids are assigned in registration order (see _build_standard_kbs)
+        students = ["Alice", "Bob", "Carol"]
+        courses = [
+            "Intro to Programming",
+            "Discrete Mathematics",
+            "Data Structures",
+            "Algorithms",
+            "Database Systems",
+            "Operating Systems",
+            "Software Engineering",
+            "Computer Networks",
+        ]
+        for sid, student in enumerate(students):
+            for cid, course in enumerate(courses):
+                self.assertEqual(matrix[sid][cid], kbs.can_take(student, course)[0])
+
+
+class TestCompiledEligibility(unittest.TestCase):
+    """compile_kbs returns a specialized check that agrees with can_take."""
+
+    def test_compiled_matches_can_take(self):
+        kbs = _build_standard_kbs()
+        kbs.complete_course("Bob", "Intro to Programming")
+        kbs.complete_course("Bob", "Data Structures")
+        eligible = kbs.compile_kbs()
+        for student in ["Alice", "Bob", "Carol"]:
+            for course in kbs.courses():
+                self.assertEqual(
+                    eligible(student, course), kbs.can_take(student, course)[0]
+                )
+
+    def test_compile_empty_catalog(self):
+        """Compiling an empty catalog must not blow up on malformed source."""
+        kbs = UniversityOntologyKBS()
+        eligible = kbs.compile_kbs()
+        # Nothing is registered, so lookups fail — but with the documented
+        # KeyError, not a SyntaxError from the generated source.
+        with self.assertRaises(KeyError):
+            eligible("Alice", "Anything")
+
+    def test_compiled_sees_new_completions(self):
+        kbs = _build_standard_kbs()
+        eligible = kbs.compile_kbs()
+        self.assertFalse(eligible("Carol", "Data Structures"))
+        kbs.complete_course("Carol", "Intro to Programming")
+        self.assertTrue(eligible("Carol", "Data Structures"))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file